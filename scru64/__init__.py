@@ -7,6 +7,8 @@ __all__ = [
     "new_string",
     "new_sync",
     "new_string_sync",
+    "new_int",
+    "new_int_sync",
     "Scru64Id",
     "Scru64Generator",
     "GlobalGenerator",
@@ -14,10 +16,8 @@ __all__ = [
     "counter_mode",
 ]
 
-import asyncio
-import datetime
 import os
-import re
+import string
 import threading
 import time
 import typing
@@ -36,12 +36,43 @@ MAX_TIMESTAMP = MAX_SCRU64_INT >> NODE_CTR_SIZE
 # The maximum valid value of the combined `node_ctr` field.
 MAX_NODE_CTR = (1 << NODE_CTR_SIZE) - 1
 
+# The rollback allowance in milliseconds used by the generator methods that read the
+# system clock.
+DEFAULT_ROLLBACK_ALLOWANCE = 10_000
+
 # Digit characters used in the Base36 notation.
 DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
 
+# Two-digit chunks of the Base36 notation indexed by values from 0 to `36^2 - 1`.
+DIGIT_PAIRS = tuple(hi + lo for hi in DIGITS for lo in DIGITS)
+
+
+def _format_int(int_value: int) -> str:
+    """Returns the 12-digit canonical string representation of a valid integer value."""
+    # convert two digits at a time (`1296 == 36^2`)
+    n, r5 = divmod(int_value, 1296)
+    n, r4 = divmod(n, 1296)
+    n, r3 = divmod(n, 1296)
+    n, r2 = divmod(n, 1296)
+    r0, r1 = divmod(n, 1296)
+    return (
+        DIGIT_PAIRS[r0]
+        + DIGIT_PAIRS[r1]
+        + DIGIT_PAIRS[r2]
+        + DIGIT_PAIRS[r3]
+        + DIGIT_PAIRS[r4]
+        + DIGIT_PAIRS[r5]
+    )
+
 
 class Scru64Id:
-    """Represents a SCRU64 ID."""
+    """
+    Represents a SCRU64 ID.
+
+    Objects are ordered by their integer representation. To sort a large collection,
+    pass `key=int` to `sorted()` or `list.sort()`, which compares plain integers instead
+    of calling the rich comparison methods of this class and thus runs much faster.
+    """
 
     __slots__ = "_value"
 
@@ -56,6 +87,13 @@ class Scru64Id:
         if not (0 <= int_value <= MAX_SCRU64_INT):
             raise ValueError("out of valid integer range")
 
+    @classmethod
+    def _unchecked(cls, int_value: int) -> Scru64Id:
+        """Creates an object from a 64-bit integer known to be in the valid range."""
+        obj = cls.__new__(cls)
+        obj._value = int_value
+        return obj
+
     def __int__(self) -> int:
         """Returns the integer representation."""
         return self._value
@@ -68,18 +106,14 @@ class Scru64Id:
         Raises:
             `ValueError` if the argument is not a valid string representation.
         """
-        if re.fullmatch(r"[0-9A-Za-z]{12}", str_value, flags=re.ASCII) is None:
+        # `int()` alone would accept signs, whitespace, underscores, etc.
+        if not (len(str_value) == 12 and str_value.isascii() and str_value.isalnum()):
             raise ValueError("invalid string representation")
         return cls(int(str_value, 36))
 
     def __str__(self) -> str:
         """Returns the 12-digit canonical string representation."""
-        buffer = ["0"] * 12
-        n = self._value
-        for i in range(12):
-            (n, rem) = divmod(n, 36)
-            buffer[11 - i] = DIGITS[rem]
-        return "".join(buffer)
+        return _format_int(self._value)
 
     @classmethod
     def from_parts(cls, timestamp: int, node_ctr: int) -> Scru64Id:
@@ -113,30 +147,31 @@ class Scru64Id:
         return f"{self.__class__.__name__}(0x{self._value:016X})"
 
     def __eq__(self, value: object) -> bool:
-        if not isinstance(value, self.__class__):
+        if not isinstance(value, Scru64Id):
             return NotImplemented
         return self._value == value._value
 
     def __hash__(self) -> int:
-        return hash(self._value)
+        # the value is a non-negative integer that fits in a machine word as is
+        return self._value
 
     def __lt__(self, value: object) -> bool:
-        if not isinstance(value, self.__class__):
+        if not isinstance(value, Scru64Id):
             return NotImplemented
         return self._value < value._value
 
     def __le__(self, value: object) -> bool:
-        if not isinstance(value, self.__class__):
+        if not isinstance(value, Scru64Id):
             return NotImplemented
         return self._value <= value._value
 
     def __gt__(self, value: object) -> bool:
-        if not isinstance(value, self.__class__):
+        if not isinstance(value, Scru64Id):
             return NotImplemented
         return self._value > value._value
 
     def __ge__(self, value: object) -> bool:
-        if not isinstance(value, self.__class__):
+        if not isinstance(value, Scru64Id):
             return NotImplemented
         return self._value >= value._value
 
@@ -150,6 +185,7 @@ class Scru64Generator:
     | Flavor                 | Timestamp | Thread- | On big clock rewind |
     | ---------------------- | --------- | ------- | ------------------- |
     | generate               | Now       | Safe    | Returns `None`      |
+    | generate_n             | Now       | Safe    | Returns `None`      |
     | generate_or_reset      | Now       | Safe    | Resets generator    |
     | generate_or_sleep      | Now       | Safe    | Sleeps (blocking)   |
     | generate_or_await      | Now       | Safe    | Sleeps (async)      |
@@ -193,8 +229,11 @@ class Scru64Generator:
         if isinstance(node_spec, str):
             node_spec = NodeSpec.parse(node_spec)
 
-        self._prev = node_spec._node_prev
+        self._prev_value = int(node_spec._node_prev)
         self._counter_size = NODE_CTR_SIZE - node_spec.node_id_size()
+        self._counter_mask = (1 << self._counter_size) - 1
+        self._node_id = node_spec.node_id()
+        self._node_id_shifted = self._node_id << self._counter_size
 
         if counter_mode is not None:
             self._counter_mode = counter_mode
@@ -205,11 +244,16 @@ class Scru64Generator:
             else:
                 self._counter_mode = DefaultCounterMode(0)
 
+        # specialize counter renewal for the built-in mode, which ignores the context
+        self._renew_default: typing.Optional[typing.Callable[[], int]] = None
+        if type(self._counter_mode) is DefaultCounterMode:
+            self._renew_default = self._counter_mode._renewer(self._counter_size)
+
         self._lock = threading.Lock()
 
     def node_id(self) -> int:
         """Returns the `node_id` of the generator."""
-        return self._prev.node_ctr >> self._counter_size
+        return self._node_id
 
     def node_id_size(self) -> int:
         """Returns the size in bits of the `node_id` adopted by the generator."""
@@ -217,19 +261,7 @@ class Scru64Generator:
 
     def node_spec(self) -> NodeSpec:
         """Returns the node configuration specifier describing the generator state."""
-        return NodeSpec(self._prev, self.node_id_size())
-
-    def _renew_node_ctr(self, timestamp: int) -> int:
-        """
-        Calculates the combined `node_ctr` field value for the next `timestamp` tick.
-        """
-        node_id = self.node_id()
-        context = RenewContext(timestamp=timestamp, node_id=node_id)
-        counter = self._counter_mode.renew(self._counter_size, context)
-        if counter >= (1 << self._counter_size):
-            raise AssertionError("illegal `CounterMode` implementation")
-
-        return (node_id << self._counter_size) | counter
+        return NodeSpec(Scru64Id._unchecked(self._prev_value), self.node_id_size())
 
     def generate(self) -> typing.Optional[Scru64Id]:
         """
@@ -239,8 +271,52 @@ class Scru64Generator:
         See the `Scru64Generator` class documentation for the description.
         """
         with self._lock:
-            timestamp = datetime.datetime.now().timestamp()
-            return self.generate_or_abort_core(int(timestamp * 1_000), 10_000)
+            return self.generate_or_abort_core(
+                time.time_ns() // 1_000_000, DEFAULT_ROLLBACK_ALLOWANCE
+            )
+
+    def generate_n(self, n: int) -> typing.Optional[typing.List[Scru64Id]]:
+        """
+        Generates `n` new SCRU64 ID objects from the current `timestamp` at once, or
+        returns `None` upon significant timestamp rollback.
+
+        This method returns the same IDs as `n` calls to `generate` made at the same
+        instant would, but it acquires the lock and reads the clock only once for the
+        whole batch. Note that `None` is returned if any of those calls would return
+        `None`, which may happen if `n` is large relative to the counter capacity; the
+        generator state is then left as it was before the call.
+
+        See the `Scru64Generator` class documentation for the description.
+
+        Raises:
+            `ValueError` if `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("`n` must be an unsigned integer")
+        values: typing.List[Scru64Id] = []
+        with self._lock:
+            unix_ts_ms = time.time_ns() // 1_000_000
+            limit = (unix_ts_ms >> 8) + (DEFAULT_ROLLBACK_ALLOWANCE >> 8)
+            prev = self._prev_value
+            while len(values) < n:
+                first = self._generate_int_or_abort_core(
+                    unix_ts_ms, DEFAULT_ROLLBACK_ALLOWANCE
+                )
+                if first is None:
+                    # discard the partial batch so as not to run ahead of the clock
+                    self._prev_value = prev
+                    return None
+
+                if (first >> NODE_CTR_SIZE) <= limit:
+                    # take the rest of the current `timestamp` tick in one go
+                    rest = self._counter_mask - (first & self._counter_mask)
+                    last = first + min(n - len(values) - 1, rest)
+                else:
+                    # leave the next increment to the core, which aborts past the limit
+                    last = first
+                values.extend(map(Scru64Id._unchecked, range(first, last + 1)))
+                self._prev_value = last
+        return values
 
     def generate_or_reset(self) -> Scru64Id:
         """
@@ -254,8 +330,9 @@ class Scru64Generator:
         duplicate results.
         """
         with self._lock:
-            timestamp = datetime.datetime.now().timestamp()
-            return self.generate_or_reset_core(int(timestamp * 1_000), 10_000)
+            return self.generate_or_reset_core(
+                time.time_ns() // 1_000_000, DEFAULT_ROLLBACK_ALLOWANCE
+            )
 
     def generate_or_sleep(self) -> Scru64Id:
         """
@@ -264,13 +341,7 @@ class Scru64Generator:
 
         See the `Scru64Generator` class documentation for the description.
         """
-        DELAY = 64.0 / 1000.0
-        while True:
-            value = self.generate()
-            if value is not None:
-                return value
-            else:
-                time.sleep(DELAY)
+        return Scru64Id._unchecked(self._generate_int_or_sleep())
 
     async def generate_or_await(self) -> Scru64Id:
         """
@@ -279,13 +350,55 @@ class Scru64Generator:
 
         See the `Scru64Generator` class documentation for the description.
         """
-        DELAY = 64.0 / 1000.0
+        return Scru64Id._unchecked(await self._generate_int_or_await())
+
+    def _generate_int(self) -> typing.Optional[int]:
+        """
+        Works like `generate` but returns the integer representation without creating
+        an intermediate object.
+        """
+        with self._lock:
+            unix_ts_ms = time.time_ns() // 1_000_000
+            return self._generate_int_or_abort_core(
+                unix_ts_ms, DEFAULT_ROLLBACK_ALLOWANCE
+            )
+
+    def _generate_int_or_sleep(self) -> int:
+        """
+        Works like `generate_or_sleep` but returns the integer representation without
+        creating an intermediate object.
+        """
         while True:
-            value = self.generate()
+            value = self._generate_int()
             if value is not None:
                 return value
             else:
-                await asyncio.sleep(DELAY)
+                time.sleep(self._delay_until_available())
+
+    async def _generate_int_or_await(self) -> int:
+        """
+        Works like `generate_or_await` but returns the integer representation without
+        creating an intermediate object.
+        """
+        while True:
+            value = self._generate_int()
+            if value is not None:
+                return value
+            else:
+                # import lazily because `asyncio` is costly to load and unused in sync code
+                import asyncio
+
+                await asyncio.sleep(self._delay_until_available())
+
+    def _delay_until_available(self) -> float:
+        """
+        Returns the delay in seconds until `generate` is expected to stop aborting,
+        clamped between 1 millisecond and 1 second.
+        """
+        prev_timestamp = self._prev_value >> NODE_CTR_SIZE
+        available_at = (prev_timestamp - (DEFAULT_ROLLBACK_ALLOWANCE >> 8)) << 8
+        delay = (available_at - time.time_ns() // 1_000_000) / 1000.0
+        return min(max(delay, 0.001), 1.0)
 
     def generate_or_reset_core(
         self, unix_ts_ms: int, rollback_allowance: int
@@ -311,10 +424,12 @@ class Scru64Generator:
         if value is not None:
             return value
         else:
-            # reset state and resume
-            timestamp = unix_ts_ms >> 8
-            self._prev = Scru64Id.from_parts(timestamp, self._renew_node_ctr(timestamp))
-            return self._prev
+            # reset state to `timestamp` zero and resume from the given `timestamp`
+            self._prev_value = self._node_id_shifted
+            value = self.generate_or_abort_core(unix_ts_ms, rollback_allowance)
+            if value is None:
+                raise AssertionError("unreachable")
+            return value
 
     def generate_or_abort_core(
         self, unix_ts_ms: int, rollback_allowance: int
@@ -332,31 +447,54 @@ class Scru64Generator:
         be protected from concurrent accesses using a mutex or other synchronization
         mechanism to avoid race conditions.
         """
+        value = self._generate_int_or_abort_core(unix_ts_ms, rollback_allowance)
+        if value is not None:
+            return Scru64Id._unchecked(value)
+        else:
+            return None
+
+    def _generate_int_or_abort_core(
+        self, unix_ts_ms: int, rollback_allowance: int
+    ) -> typing.Optional[int]:
+        """
+        Works like `generate_or_abort_core` but returns the integer value of the new
+        SCRU64 ID instead of an object.
+        """
         timestamp = unix_ts_ms >> 8
         allowance = rollback_allowance >> 8
-        if timestamp <= 0:
+        if timestamp <= 0 or timestamp > MAX_TIMESTAMP:
             raise ValueError("`timestamp` out of range")
         elif allowance < 0 or allowance >= (1 << 40):
             raise ValueError("`rollback_allowance` out of reasonable range")
 
-        prev_timestamp = self._prev.timestamp
-        if timestamp > prev_timestamp:
-            self._prev = Scru64Id.from_parts(timestamp, self._renew_node_ctr(timestamp))
-        elif timestamp + allowance >= prev_timestamp:
-            # go on with previous timestamp if new one is not much smaller
-            prev_node_ctr = self._prev.node_ctr
-            counter_mask = (1 << self._counter_size) - 1
-            if (prev_node_ctr & counter_mask) < counter_mask:
-                self._prev = Scru64Id.from_parts(prev_timestamp, prev_node_ctr + 1)
-            else:
+        prev = self._prev_value
+        prev_timestamp = prev >> NODE_CTR_SIZE
+        if timestamp <= prev_timestamp:
+            counter_mask = self._counter_mask
+            if timestamp + allowance < prev_timestamp:
+                # abort if clock went backwards to unbearable extent
+                return None
+            elif (prev & counter_mask) != counter_mask:
+                # go on with previous timestamp if new one is not much smaller
+                self._prev_value = prev + 1
+                return prev + 1
+            elif prev_timestamp < MAX_TIMESTAMP:
                 # increment timestamp at counter overflow
-                self._prev = Scru64Id.from_parts(
-                    prev_timestamp + 1, self._renew_node_ctr(prev_timestamp + 1)
-                )
+                timestamp = prev_timestamp + 1
+            else:
+                raise ValueError("`timestamp` out of range")
+
+        # renew counter for the new `timestamp` tick
+        if self._renew_default is not None:
+            counter = self._renew_default()
         else:
-            # abort if clock went backwards to unbearable extent
-            return None
-        return self._prev
+            context = RenewContext(timestamp=timestamp, node_id=self._node_id)
+            counter = self._counter_mode.renew(self._counter_size, context)
+            if not (0 <= counter <= self._counter_mask):
+                raise AssertionError("illegal `CounterMode` implementation")
+
+        self._prev_value = timestamp << NODE_CTR_SIZE | self._node_id_shifted | counter
+        return self._prev_value
 
 
 class NodeSpec:
@@ -425,24 +563,23 @@ class NodeSpec:
         Raises:
             `ValueError` if an invalid `node_spec` string is passed.
         """
-        m = re.fullmatch(
-            r"(?:([0-9a-z]{12})|([0-9]{1,8})|0x([0-9a-f]{1,6}))\/([0-9]{1,3})",
-            node_spec,
-            flags=re.ASCII | re.IGNORECASE,
+        head, sep, tail = node_spec.partition("/")
+        if sep and node_spec.isascii() and 1 <= len(tail) <= 3 and tail.isdigit():
+            node_id_size = int(tail, 10)
+            if len(head) == 12 and head.isalnum():
+                return cls(Scru64Id.from_str(head), node_id_size)
+            elif 1 <= len(head) <= 8 and head.isdigit():
+                return cls(int(head, 10), node_id_size)
+            elif (
+                3 <= len(head) <= 8
+                and head[:2] in ("0x", "0X")
+                and all(c in string.hexdigits for c in head[2:])
+            ):
+                return cls(int(head[2:], 16), node_id_size)
+
+        raise ValueError(
+            'could not parse string as node spec (expected: e.g., "42/8", "0xb00/12", "0u2r85hm2pt3/16")'
         )
-        if m is None:
-            raise ValueError(
-                'could not parse string as node spec (expected: e.g., "42/8", "0xb00/12", "0u2r85hm2pt3/16")'
-            )
-        node_id_size = int(m[4], 10)
-        if m[1] is not None:
-            return cls(Scru64Id.from_str(m[1]), node_id_size)
-        elif m[2] is not None:
-            return cls(int(m[2], 10), node_id_size)
-        elif m[3] is not None:
-            return cls(int(m[3], 16), node_id_size)
-        else:
-            raise AssertionError("unreachable")
 
     def __str__(self) -> str:
         node_prev = self.node_prev()
@@ -559,7 +696,7 @@ def new_sync() -> Scru64Id:
     Raises:
         An error if the global generator is not properly configured.
     """
-    return GlobalGenerator.generate_or_sleep()
+    return GlobalGenerator._get().generate_or_sleep()
 
 
 def new_string_sync() -> str:
@@ -584,7 +721,32 @@ def new_string_sync() -> str:
     Raises:
         An error if the global generator is not properly configured.
     """
-    return str(new_sync())
+    return _format_int(GlobalGenerator._get()._generate_int_or_sleep())
+
+
+def new_int_sync() -> int:
+    """
+    Generates a new SCRU64 ID encoded in the 64-bit unsigned integer representation
+    using the global generator.
+
+    By default, the global generator reads the node configuration from the
+    `SCRU64_NODE_SPEC` environment variable when a generator method is first called, and
+    it raises an error if it fails to do so. The node configuration is encoded in a node
+    spec string consisting of `node_id` and `node_id_size` integers separated by a slash
+    (e.g., "42/8", "0xb00/12"; see `NodeSpec` for details). You can configure the global
+    generator differently by calling `GlobalGenerator.initialize` before the default
+    initializer is triggered.
+
+    This function usually returns a value immediately, but if not possible, it sleeps
+    and waits for the next timestamp tick. It employs blocking sleep to wait; see
+    `new_int` for the non-blocking equivalent.
+
+    This function is thread-safe; multiple threads can call it concurrently.
+
+    Raises:
+        An error if the global generator is not properly configured.
+    """
+    return GlobalGenerator._get()._generate_int_or_sleep()
 
 
 async def new() -> Scru64Id:
@@ -607,7 +769,7 @@ async def new() -> Scru64Id:
     Raises:
         An error if the global generator is not properly configured.
     """
-    return await GlobalGenerator.generate_or_await()
+    return await GlobalGenerator._get().generate_or_await()
 
 
 async def new_string() -> str:
@@ -631,4 +793,28 @@ async def new_string() -> str:
     Raises:
         An error if the global generator is not properly configured.
     """
-    return str(await GlobalGenerator.generate_or_await())
+    return _format_int(await GlobalGenerator._get()._generate_int_or_await())
+
+
+async def new_int() -> int:
+    """
+    Generates a new SCRU64 ID encoded in the 64-bit unsigned integer representation
+    using the global generator.
+
+    By default, the global generator reads the node configuration from the
+    `SCRU64_NODE_SPEC` environment variable when a generator method is first called, and
+    it raises an error if it fails to do so. The node configuration is encoded in a node
+    spec string consisting of `node_id` and `node_id_size` integers separated by a slash
+    (e.g., "42/8", "0xb00/12"; see `NodeSpec` for details). You can configure the global
+    generator differently by calling `GlobalGenerator.initialize` before the default
+    initializer is triggered.
+
+    This function usually returns a value immediately, but if not possible, it sleeps
+    and waits for the next timestamp tick.
+
+    This function is thread-safe; multiple threads can call it concurrently.
+
+    Raises:
+        An error if the global generator is not properly configured.
+    """
+    return await GlobalGenerator._get()._generate_int_or_await()
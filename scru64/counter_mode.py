@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import random
 import typing
 
@@ -62,3 +63,14 @@ class DefaultCounterMode:
             return random.getrandbits(counter_size - self._overflow_guard_size)
         else:
             return 0
+
+    def _renewer(self, counter_size: int) -> typing.Callable[[], int]:
+        """
+        Returns a function equivalent to `renew` with `counter_size` fixed, which
+        `Scru64Generator` calls directly without building a `RenewContext`.
+        """
+        if counter_size > self._overflow_guard_size:
+            bits = counter_size - self._overflow_guard_size
+            return functools.partial(random.getrandbits, bits)
+        else:
+            return lambda: 0
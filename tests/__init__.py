@@ -1,18 +1,16 @@
 from __future__ import annotations
 
-import dataclasses
+import typing
 
 
-@dataclasses.dataclass(frozen=True)
-class ExampleId:
+class ExampleId(typing.NamedTuple):
     text: str
     num: int
     timestamp: int
     node_ctr: int
 
 
-@dataclasses.dataclass(frozen=True)
-class ExampleNodeSpec:
+class ExampleNodeSpec(typing.NamedTuple):
     node_spec: str
     canonical: str
     spec_type: str
@@ -21,7 +19,7 @@ class ExampleNodeSpec:
     node_prev: int
 
 
-EXAMPLE_IDS: list[ExampleId] = [
+EXAMPLE_IDS: tuple[ExampleId, ...] = (
     ExampleId(text="000000000000", num=0x0000000000000000, timestamp=0, node_ctr=0),
     ExampleId(
         text="00000009zldr", num=0x0000000000FFFFFF, timestamp=0, node_ctr=16777215
@@ -155,9 +153,9 @@ EXAMPLE_IDS: list[ExampleId] = [
         timestamp=177051235243,
         node_ctr=4496061,
     ),
-]
+)
 
-EXAMPLE_NODE_SPECS: list[ExampleNodeSpec] = [
+EXAMPLE_NODE_SPECS: tuple[ExampleNodeSpec, ...] = (
     ExampleNodeSpec(
         node_spec="0/1",
         canonical="0/1",
@@ -462,4 +460,4 @@ EXAMPLE_NODE_SPECS: list[ExampleNodeSpec] = [
         node_id_size=23,
         node_prev=0x29391373AB449ABD,
     ),
-]
+)
@@ -24,19 +24,34 @@ class TestCounterMode(unittest.TestCase):
         context = RenewContext(timestamp=0x0123_4567_89AB, node_id=0)
         for counter_size in range(1, 24):
             for overflow_guard_size in range(24):
-                # count number of set bits by bit position (from LSB to MSB)
-                counts_by_pos = [0] * 24
-
-                c = DefaultCounterMode(overflow_guard_size)
-                for _ in range(N_LOOPS):
-                    n = c.renew(counter_size, context)
-                    for i in range(24):
-                        counts_by_pos[i] += n & 1
-                        n >>= 1
-                    self.assertEqual(n, 0)
-
+                with self.subTest(
+                    counter_size=counter_size, overflow_guard_size=overflow_guard_size
+                ):
+                    c = DefaultCounterMode(overflow_guard_size)
+                    samples = [c.renew(counter_size, context) for _ in range(N_LOOPS)]
+
+                    # check all guard bits are zero at once with the upper bound
+                    filled = max(0, counter_size - overflow_guard_size)
+                    self.assertGreaterEqual(min(samples), 0)
+                    self.assertLess(max(samples), 1 << filled)
+
+                    # count number of set bits by bit position (from LSB to MSB)
+                    counts_by_pos = [
+                        sum(n >> i & 1 for n in samples) for i in range(filled)
+                    ]
+                    for e in counts_by_pos:
+                        self.assertLess(abs(e / N_LOOPS - 0.5), margin)
+
+    def test_default_counter_mode_renewer(self) -> None:
+        """
+        The specialized renewer of `DefaultCounterMode` honors the guard bits as
+        `renew` does.
+        """
+        for counter_size in range(1, 24):
+            for overflow_guard_size in range(24):
                 filled = max(0, counter_size - overflow_guard_size)
-                for e in counts_by_pos[:filled]:
-                    self.assertLess(abs(e / N_LOOPS - 0.5), margin)
-                for e in counts_by_pos[filled:]:
-                    self.assertEqual(e, 0)
+                renew = DefaultCounterMode(overflow_guard_size)._renewer(counter_size)
+                for _ in range(64):
+                    n = renew()
+                    self.assertGreaterEqual(n, 0)
+                    self.assertLess(n, 1 << filled)
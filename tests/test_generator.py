@@ -1,13 +1,27 @@
 from __future__ import annotations
 
-import datetime
+import time
 import unittest
+from unittest import mock
 
-from scru64 import NodeSpec, Scru64Generator, Scru64Id
+from scru64 import DEFAULT_ROLLBACK_ALLOWANCE, NodeSpec, Scru64Generator, Scru64Id
+from scru64.counter_mode import RenewContext
 
 from . import EXAMPLE_NODE_SPECS
 
 
+class FixedCounterMode:
+    """A `CounterMode` that always returns the same counter and records contexts."""
+
+    def __init__(self, counter: int) -> None:
+        self.counter = counter
+        self.contexts: list[RenewContext] = []
+
+    def renew(self, counter_size: int, context: RenewContext) -> int:
+        self.contexts.append(context)
+        return self.counter
+
+
 class TestGenerator(unittest.TestCase):
     def _assert_consecutive(self, first: Scru64Id, second: Scru64Id) -> None:
         self.assertLess(first, second)
@@ -22,114 +36,220 @@ class TestGenerator(unittest.TestCase):
         """
         N_LOOPS = 64
         ALLOWANCE = 10_000
+        ALLOWANCE_TICKS = ALLOWANCE >> 8  # in units of 256 milliseconds
 
         for e in EXAMPLE_NODE_SPECS:
-            counter_size = 24 - e.node_id_size
-            g = Scru64Generator(NodeSpec(e.node_id, e.node_id_size))
-
-            # happy path
-            ts = 1_577_836_800_000  # 2020-01-01
-            prev = g.generate_or_reset_core(ts, ALLOWANCE)
-            for _ in range(N_LOOPS):
-                ts += 16
-                curr = g.generate_or_reset_core(ts, ALLOWANCE)
-                self._assert_consecutive(prev, curr)
-                self.assertLess(curr.timestamp - (ts >> 8), ALLOWANCE >> 8)
-                self.assertEqual(curr.node_ctr >> counter_size, e.node_id)
-
-                prev = curr
-
-            # keep monotonic order under mildly decreasing timestamps
-            ts += ALLOWANCE * 16
-            prev = g.generate_or_reset_core(ts, ALLOWANCE)
-            for _ in range(N_LOOPS):
-                ts -= 16
-                curr = g.generate_or_reset_core(ts, ALLOWANCE)
-                self._assert_consecutive(prev, curr)
-                self.assertLess(curr.timestamp - (ts >> 8), ALLOWANCE >> 8)
-                self.assertEqual(curr.node_ctr >> counter_size, e.node_id)
-
-                prev = curr
-
-            # reset state with significantly decreasing timestamps
-            ts += ALLOWANCE * 16
-            prev = g.generate_or_reset_core(ts, ALLOWANCE)
-            for _ in range(N_LOOPS):
-                ts -= ALLOWANCE + 0x100
-                curr = g.generate_or_reset_core(ts, ALLOWANCE)
-                self.assertGreater(prev, curr)
-                self.assertLess(curr.timestamp - (ts >> 8), ALLOWANCE >> 8)
-                self.assertEqual(curr.node_ctr >> counter_size, e.node_id)
-
-                prev = curr
+            with self.subTest(node_spec=e.node_spec):
+                counter_size = 24 - e.node_id_size
+                g = Scru64Generator(NodeSpec(e.node_id, e.node_id_size))
+
+                # happy path
+                ts = 1_577_836_800_000  # 2020-01-01
+                prev = g.generate_or_reset_core(ts, ALLOWANCE)
+                for _ in range(N_LOOPS):
+                    ts += 16
+                    curr = g.generate_or_reset_core(ts, ALLOWANCE)
+                    self._assert_consecutive(prev, curr)
+                    self.assertLess(curr.timestamp - (ts >> 8), ALLOWANCE_TICKS)
+                    self.assertEqual(curr.node_ctr >> counter_size, e.node_id)
+
+                    prev = curr
+
+                # keep monotonic order under mildly decreasing timestamps
+                ts += ALLOWANCE * 16
+                prev = g.generate_or_reset_core(ts, ALLOWANCE)
+                for _ in range(N_LOOPS):
+                    ts -= 16
+                    curr = g.generate_or_reset_core(ts, ALLOWANCE)
+                    self._assert_consecutive(prev, curr)
+                    self.assertLess(curr.timestamp - (ts >> 8), ALLOWANCE_TICKS)
+                    self.assertEqual(curr.node_ctr >> counter_size, e.node_id)
+
+                    prev = curr
+
+                # reset state with significantly decreasing timestamps
+                ts += ALLOWANCE * 16
+                prev = g.generate_or_reset_core(ts, ALLOWANCE)
+                for _ in range(N_LOOPS):
+                    ts -= ALLOWANCE + 0x100
+                    curr = g.generate_or_reset_core(ts, ALLOWANCE)
+                    self.assertGreater(prev, curr)
+                    self.assertLess(curr.timestamp - (ts >> 8), ALLOWANCE_TICKS)
+                    self.assertEqual(curr.node_ctr >> counter_size, e.node_id)
+
+                    prev = curr
 
     def test_generate_or_abort(self) -> None:
         """Normally generates monotonic IDs or aborts upon significant rollback."""
         N_LOOPS = 64
         ALLOWANCE = 10_000
+        ALLOWANCE_TICKS = ALLOWANCE >> 8  # in units of 256 milliseconds
+
+        for e in EXAMPLE_NODE_SPECS:
+            with self.subTest(node_spec=e.node_spec):
+                counter_size = 24 - e.node_id_size
+                g = Scru64Generator(NodeSpec(e.node_id, e.node_id_size))
+
+                # happy path
+                ts = 1_577_836_800_000  # 2020-01-01
+                prev = g.generate_or_abort_core(ts, ALLOWANCE)
+                assert prev is not None
+                for _ in range(N_LOOPS):
+                    ts += 16
+                    curr = g.generate_or_abort_core(ts, ALLOWANCE)
+                    assert curr is not None
+                    self._assert_consecutive(prev, curr)
+                    self.assertLess(curr.timestamp - (ts >> 8), ALLOWANCE_TICKS)
+                    self.assertEqual(curr.node_ctr >> counter_size, e.node_id)
+
+                    prev = curr
+
+                # keep monotonic order under mildly decreasing timestamps
+                ts += ALLOWANCE * 16
+                prev = g.generate_or_abort_core(ts, ALLOWANCE)
+                assert prev is not None
+                for _ in range(N_LOOPS):
+                    ts -= 16
+                    curr = g.generate_or_abort_core(ts, ALLOWANCE)
+                    assert curr is not None
+                    self._assert_consecutive(prev, curr)
+                    self.assertLess(curr.timestamp - (ts >> 8), ALLOWANCE_TICKS)
+                    self.assertEqual(curr.node_ctr >> counter_size, e.node_id)
+
+                    prev = curr
+
+                # abort with significantly decreasing timestamps
+                ts += ALLOWANCE * 16
+                g.generate_or_abort_core(ts, ALLOWANCE)
+                ts -= ALLOWANCE + 0x100
+                for _ in range(N_LOOPS):
+                    ts -= 16
+                    self.assertIsNone(g.generate_or_abort_core(ts, ALLOWANCE))
+
+    def test_custom_counter_mode(self) -> None:
+        """Renews counter through a custom `CounterMode` and rejects illegal values."""
+        ts = 1_577_836_800_000  # 2020-01-01
+        for e in EXAMPLE_NODE_SPECS:
+            with self.subTest(node_spec=e.node_spec):
+                counter_size = 24 - e.node_id_size
+                counter_mask = (1 << counter_size) - 1
+                node_spec = NodeSpec(e.node_id, e.node_id_size)
+
+                mode = FixedCounterMode(counter_mask)
+                g = Scru64Generator(node_spec, counter_mode=mode)
+                x = g.generate_or_abort_core(ts, 10_000)
+                assert x is not None
+                self.assertEqual(x.timestamp, ts >> 8)
+                self.assertEqual(x.node_ctr, e.node_id << counter_size | counter_mask)
+                self.assertEqual(
+                    mode.contexts, [RenewContext(timestamp=ts >> 8, node_id=e.node_id)]
+                )
+
+                for counter in (-1, counter_mask + 1):
+                    mode = FixedCounterMode(counter)
+                    g = Scru64Generator(node_spec, counter_mode=mode)
+                    with self.assertRaises(AssertionError):
+                        g.generate_or_abort_core(ts, 10_000)
+
+    def test_generate_n(self) -> None:
+        """Generates a batch of monotonic IDs in a row."""
+        N_IDS = 64
 
         for e in EXAMPLE_NODE_SPECS:
-            counter_size = 24 - e.node_id_size
-            g = Scru64Generator(NodeSpec(e.node_id, e.node_id_size))
-
-            # happy path
-            ts = 1_577_836_800_000  # 2020-01-01
-            prev = g.generate_or_abort_core(ts, ALLOWANCE)
-            assert prev is not None
-            for _ in range(N_LOOPS):
-                ts += 16
-                curr = g.generate_or_abort_core(ts, ALLOWANCE)
-                assert curr is not None
-                self._assert_consecutive(prev, curr)
-                self.assertLess(curr.timestamp - (ts >> 8), ALLOWANCE >> 8)
-                self.assertEqual(curr.node_ctr >> counter_size, e.node_id)
-
-                prev = curr
-
-            # keep monotonic order under mildly decreasing timestamps
-            ts += ALLOWANCE * 16
-            prev = g.generate_or_abort_core(ts, ALLOWANCE)
-            assert prev is not None
-            for _ in range(N_LOOPS):
-                ts -= 16
-                curr = g.generate_or_abort_core(ts, ALLOWANCE)
-                assert curr is not None
-                self._assert_consecutive(prev, curr)
-                self.assertLess(curr.timestamp - (ts >> 8), ALLOWANCE >> 8)
-                self.assertEqual(curr.node_ctr >> counter_size, e.node_id)
-
-                prev = curr
-
-            # abort with significantly decreasing timestamps
-            ts += ALLOWANCE * 16
-            g.generate_or_abort_core(ts, ALLOWANCE)
-            ts -= ALLOWANCE + 0x100
-            for _ in range(N_LOOPS):
-                ts -= 16
-                self.assertIsNone(g.generate_or_abort_core(ts, ALLOWANCE))
+            with self.subTest(node_spec=e.node_spec):
+                counter_size = 24 - e.node_id_size
+                g = Scru64Generator(NodeSpec(e.node_id, e.node_id_size))
+
+                first = g.generate()
+                batch = g.generate_n(N_IDS)
+                last = g.generate()
+                assert first is not None and batch is not None and last is not None
+                self.assertEqual(len(batch), N_IDS)
+
+                prev = first
+                for curr in batch + [last]:
+                    self._assert_consecutive(prev, curr)
+                    self.assertEqual(curr.node_ctr >> counter_size, e.node_id)
+                    prev = curr
+
+                self.assertEqual(g.generate_n(0), [])
+                with self.assertRaises(ValueError):
+                    g.generate_n(-1)
+
+    def test_generate_n_abort(self) -> None:
+        """Leaves state untouched when a batch exceeds the rollback allowance."""
+        # only two IDs per `timestamp` tick are available with this node spec
+        g = Scru64Generator(NodeSpec(0, 23))
+        node_prev = g.node_spec()._node_prev
+
+        self.assertIsNone(g.generate_n(200))
+        self.assertEqual(g.node_spec()._node_prev, node_prev)
+        self.assertIsNotNone(g.generate())
+
+    def test_generate_n_at_allowance_edge(self) -> None:
+        """Returns what as many `generate` calls would near the rollback allowance."""
+        unix_ts_ms = 1_577_836_800_000  # 2020-01-01
+        ts_limit = (unix_ts_ms >> 8) + (DEFAULT_ROLLBACK_ALLOWANCE >> 8)
+        cases = (
+            Scru64Id.from_parts(ts_limit - 1, 0xFF_FFFF),
+            Scru64Id.from_parts(ts_limit, 0xFF_0000),
+            Scru64Id.from_parts(ts_limit, 0xFF_FFFF),
+        )
+
+        with mock.patch("time.time_ns", return_value=unix_ts_ms * 1_000_000):
+            for node_prev in cases:
+                for k in range(1, 5):
+                    with self.subTest(node_prev=node_prev, k=k):
+                        node_spec = NodeSpec(node_prev, 8)
+                        g = Scru64Generator(node_spec, counter_mode=FixedCounterMode(0))
+                        seq = [g.generate() for _ in range(k)]
+                        expected = None if None in seq else seq
+
+                        g = Scru64Generator(node_spec, counter_mode=FixedCounterMode(0))
+                        self.assertEqual(g.generate_n(k), expected)
+
+    def test_sleep_on_rollback(self) -> None:
+        """Waits for the clock to catch up with the state upon significant rollback."""
+        ts_now = time.time_ns() // 256_000_000  # (milliseconds >> 8)
+        node_prev = Scru64Id.from_parts(
+            ts_now + (DEFAULT_ROLLBACK_ALLOWANCE >> 8) + 2, 0
+        )
+        g = Scru64Generator(NodeSpec(node_prev, 8))
+        self.assertIsNone(g.generate())
+        self.assertLess(node_prev, g.generate_or_sleep())
 
 
 class TestGeneratorAsync(unittest.IsolatedAsyncioTestCase):
     def now(self) -> int:
-        return int(datetime.datetime.now().timestamp() * 1_000) >> 8
+        return time.time_ns() // 256_000_000  # (milliseconds >> 8)
 
     async def test_clock_integration(self) -> None:
         """Embeds up-to-date timestamp."""
         for e in EXAMPLE_NODE_SPECS:
-            g = Scru64Generator(NodeSpec(e.node_id, e.node_id_size))
-            ts_now = self.now()
-            x = g.generate()
-            assert x is not None
-            self.assertLessEqual(x.timestamp - ts_now, 1)
-
-            ts_now = self.now()
-            x = g.generate_or_reset()
-            self.assertLessEqual(x.timestamp - ts_now, 1)
-
-            ts_now = self.now()
-            x = g.generate_or_sleep()
-            self.assertLessEqual(x.timestamp - ts_now, 1)
-
-            ts_now = self.now()
-            x = await g.generate_or_await()
-            self.assertLessEqual(x.timestamp - ts_now, 1)
+            with self.subTest(node_spec=e.node_spec):
+                g = Scru64Generator(NodeSpec(e.node_id, e.node_id_size))
+                ts_now = self.now()
+                x = g.generate()
+                assert x is not None
+                self.assertLessEqual(x.timestamp - ts_now, 1)
+
+                ts_now = self.now()
+                x = g.generate_or_reset()
+                self.assertLessEqual(x.timestamp - ts_now, 1)
+
+                ts_now = self.now()
+                x = g.generate_or_sleep()
+                self.assertLessEqual(x.timestamp - ts_now, 1)
+
+                ts_now = self.now()
+                x = await g.generate_or_await()
+                self.assertLessEqual(x.timestamp - ts_now, 1)
+
+    async def test_await_on_rollback(self) -> None:
+        """Waits for the clock to catch up with the state upon significant rollback."""
+        node_prev = Scru64Id.from_parts(
+            self.now() + (DEFAULT_ROLLBACK_ALLOWANCE >> 8) + 2, 0
+        )
+        g = Scru64Generator(NodeSpec(node_prev, 8))
+        self.assertIsNone(g.generate())
+        self.assertLess(node_prev, await g.generate_or_await())
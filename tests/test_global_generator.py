@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 import unittest
 
-from scru64 import GlobalGenerator, new_string_sync, new_string
+from scru64 import GlobalGenerator, new_int, new_int_sync, new_string, new_string_sync
 
 os.environ["SCRU64_NODE_SPEC"] = "42/8"
 
@@ -16,18 +16,22 @@ class TestGlobalGenerator(unittest.TestCase):
 
     def test_new_string_sync(self) -> None:
         """Generates 10k monotonically increasing IDs"""
-        prev = new_string_sync()
-        for i in range(10_000):
-            curr = new_string_sync()
-            self.assertLess(prev, curr)
-            prev = curr
+        ids = [new_string_sync() for _ in range(10_001)]
+        self.assertEqual(ids, sorted(set(ids)))
+
+    def test_new_int_sync(self) -> None:
+        """Generates 10k monotonically increasing integers"""
+        ids = [new_int_sync() for _ in range(10_001)]
+        self.assertEqual(ids, sorted(set(ids)))
 
 
 class TestGlobalGeneratorAsync(unittest.IsolatedAsyncioTestCase):
     async def test_new_string(self) -> None:
         """Generates 10k monotonically increasing IDs"""
-        prev = await new_string()
-        for i in range(10_000):
-            curr = await new_string()
-            self.assertLess(prev, curr)
-            prev = curr
+        ids = [await new_string() for _ in range(10_001)]
+        self.assertEqual(ids, sorted(set(ids)))
+
+    async def test_new_int(self) -> None:
+        """Generates 10k monotonically increasing integers"""
+        ids = [await new_int() for _ in range(10_001)]
+        self.assertEqual(ids, sorted(set(ids)))
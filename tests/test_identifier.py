@@ -88,7 +88,7 @@ class TestIdentifier(unittest.TestCase):
 
     def test_parse_error(self) -> None:
         """Fails to parse invalid textual representations."""
-        cases = [
+        cases = (
             "",
             " 0u3wrp5g81jx",
             "0u3wrp5g81jy ",
@@ -100,7 +100,8 @@ class TestIdentifier(unittest.TestCase):
             "0u3w_p5q7ta7",
             "0u3wrp5-7ta8",
             "0u3wrp5q7t 9",
-        ]
+            "\uff10u3wrp5q7taa",
+        )
 
         for e in cases:
             with self.assertRaises(ValueError):
@@ -39,7 +39,7 @@ class TestNodeSpec(unittest.TestCase):
 
     def test_constructor_error(self) -> None:
         """Fails to initialize with invalid node spec string."""
-        cases = [
+        cases = (
             "",
             "42",
             "/8",
@@ -61,7 +61,12 @@ class TestNodeSpec(unittest.TestCase):
             "0000000000001/8",
             "1/0016",
             "42/800",
-        ]
+            "4_2/8",
+            "0x4_2/8",
+            "42/0_8",
+            "\uff14\uff12/8",
+            "42/\uff18",
+        )
 
         for e in cases:
             with self.assertRaises(Exception):